@@ -1,13 +1,42 @@
 
-from flask import Flask, render_template, request, jsonify
-from schedulers import ProcessScheduler
-from utils import generate_execution_timeline
+import io
+
+from flask import Flask, render_template, request, jsonify, send_file
+from schedulers import ProcessScheduler, AlgoritmoNoSoportado, get_engines
+from utils import DependenciaNoInstalada, FORMATOS_EXPORTACION, FORMATOS_ARCHIVO
+from utils.export import TABLAS_EXPORTACION, build_columns, write_table
 
 app = Flask(__name__)
 
 # Instancia global del scheduler
 scheduler = ProcessScheduler()
 
+def _ejecutar_simulacion(data):
+    """
+    Cargar los procesos de la petición y ejecutar el algoritmo seleccionado
+    
+    Returns:
+        list: Log de ejecución del algoritmo
+    """
+    processes = data['processes']
+    algorithm = data['algorithm']
+    quantum = data.get('quantum', 2)
+    
+    # Limpiar scheduler anterior
+    scheduler.clear_processes()
+    
+    # Agregar procesos
+    for process in processes:
+        scheduler.add_process(
+            process['pid'],
+            process['arrival_time'],
+            process['burst_time'],
+            process.get('priority', 0)
+        )
+    
+    # Ejecutar con el motor más rápido para el tamaño y las opciones de la petición
+    return scheduler.run(algorithm, quantum, data.get('engine') or None, data.get('require') or ())
+
 @app.route('/')
 def index():
     """Página principal de la aplicación"""
@@ -18,52 +47,66 @@ def simulate():
     """Endpoint para ejecutar la simulación de planificación de procesos"""
     try:
         data = request.get_json()
-        processes = data['processes']
-        algorithm = data['algorithm']
-        quantum = data.get('quantum', 2)
-        
-        # Limpiar scheduler anterior
-        scheduler.clear_processes()
-        
-        # Agregar procesos
-        for process in processes:
-            scheduler.add_process(
-                process['pid'],
-                process['arrival_time'],
-                process['burst_time'],
-                process.get('priority', 0)
-            )
+        execution_log = _ejecutar_simulacion(data)
         
-        # Ejecutar algoritmo seleccionado
-        if algorithm == 'fcfs':
-            execution_log = scheduler.fcfs_scheduling()
-        elif algorithm == 'sjf':
-            execution_log = scheduler.sjf_scheduling()
-        elif algorithm == 'rr':
-            execution_log = scheduler.round_robin_scheduling(quantum)
-        else:
-            return jsonify({'error': f'Algoritmo no soportado: {algorithm}'}), 400
+        # Crear timeline detallado para animación
+        timeline_data = scheduler.get_timeline_data()
         
         # Obtener estadísticas y datos
         process_stats = scheduler.get_process_stats()
         pcb_data = scheduler.get_pcb_data()
         
-        # Crear timeline detallado para animación
-        timeline_data = generate_execution_timeline(
-            scheduler.processes, 
-            algorithm, 
-            quantum if algorithm == 'rr' else None
-        )
-        
         return jsonify({
             'execution_log': execution_log,
             'process_stats': process_stats,
             'timeline_data': timeline_data,
-            'pcb_data': pcb_data
+            'pcb_data': pcb_data,
+            'engine': scheduler.engine.name
         })
         
+    except AlgoritmoNoSoportado as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': f'Error en la simulación: {str(e)}'}), 500
 
+@app.route('/engines')
+def engines():
+    """Endpoint para listar los motores de planificación registrados"""
+    return jsonify([motor.to_dict() for motor in get_engines()])
+
+@app.route('/export', methods=['POST'])
+def export():
+    """Endpoint para descargar los resultados en formato columnar (NPZ, Arrow o Parquet)"""
+    try:
+        data = request.get_json()
+        formato = data.get('format', 'npz')
+        tabla = data.get('table', 'process_stats')
+        
+        if formato not in FORMATOS_ARCHIVO:
+            return jsonify({'error': f'Formato de exportación no soportado: {formato}'}), 400
+        if tabla not in TABLAS_EXPORTACION:
+            return jsonify({'error': f'Tabla no soportada: {tabla}'}), 400
+        
+        _ejecutar_simulacion(data)
+        columnas = build_columns(scheduler.get_process_stats(), scheduler.get_segments())[tabla]
+        
+        archivo = io.BytesIO()
+        write_table(columnas, archivo, formato)
+        archivo.seek(0)
+        
+        return send_file(
+            archivo,
+            mimetype='application/octet-stream',
+            as_attachment=True,
+            download_name=tabla + FORMATOS_EXPORTACION[formato]
+        )
+        
+    except AlgoritmoNoSoportado as e:
+        return jsonify({'error': str(e)}), 400
+    except DependenciaNoInstalada as e:
+        return jsonify({'error': str(e)}), 501
+    except Exception as e:
+        return jsonify({'error': f'Error en la exportación: {str(e)}'}), 500
+
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
@@ -2,5 +2,6 @@
 
 from .process_scheduler import ProcessScheduler
 from .algorithms import SchedulingAlgorithms
+from .registry import SchedulerEngine, AlgoritmoNoSoportado, register_scheduler, select_engine, get_engines
 
-__all__ = ['ProcessScheduler', 'SchedulingAlgorithms']
\ No newline at end of file
+__all__ = ['ProcessScheduler', 'SchedulingAlgorithms', 'SchedulerEngine', 'AlgoritmoNoSoportado', 'register_scheduler', 'select_engine', 'get_engines']
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+Algoritmos de Planificación Optimizados
+=======================================
+Variantes rápidas de los algoritmos de referencia de algorithms.py para
+cargas de trabajo grandes. Producen exactamente el mismo historial, los
+mismos tiempos y el mismo timeline (verificado con schedulers.fuzzing).
+
+También genera los segmentos de ejecución (pid, inicio, fin) directamente a
+partir de los eventos de planificación, sin expandir el timeline por unidad.
+"""
+
+import math
+from collections import deque
+
+from schedulers.algorithms import SchedulingAlgorithms
+
+
+def _planificar_rr(processes, quantum):
+    """
+    Núcleo de Round Robin dirigido por eventos
+
+    En lugar de recorrer la lista de pendientes en cada paso y avanzar el
+    tiempo de uno en uno, ordena las llegadas una sola vez, salta
+    directamente a la siguiente llegada cuando la CPU está ociosa y usa
+    una deque para la cola de listos.
+
+    Genera tuplas de eventos:
+        ('llegada', tiempo, pid)
+        ('ejecucion', tiempo, pid, duracion)
+        ('espera', tiempo, pid, restante)
+        ('fin', tiempo, pid, arrival_time, burst_time)
+    """
+    tiempo_actual = 0
+    cola_listos = deque()
+    tiempo_restante = {p.pid: p.burst_time for p in processes}
+
+    # Orden de llegada; los que llegan en el mismo paso se encolan en el orden original
+    pendientes = sorted(enumerate(processes), key=lambda item: item[1].arrival_time)
+    siguiente = 0
+
+    def agregar_procesos_llegados():
+        nonlocal siguiente
+        fin = siguiente
+        while fin < len(pendientes) and pendientes[fin][1].arrival_time <= tiempo_actual:
+            fin += 1
+        if fin == siguiente:
+            return []
+        llegaron = sorted(pendientes[siguiente:fin], key=lambda item: item[0])
+        siguiente = fin
+        return [p for _, p in llegaron]
+
+    while siguiente < len(pendientes) or cola_listos:
+        for proceso in agregar_procesos_llegados():
+            cola_listos.append(proceso)
+            yield ('llegada', tiempo_actual, proceso.pid)
+
+        if not cola_listos:
+            # Saltar en pasos enteros hasta la siguiente llegada
+            tiempo_actual += max(1, math.ceil(pendientes[siguiente][1].arrival_time - tiempo_actual))
+            continue
+
+        proceso = cola_listos.popleft()
+        pid = proceso.pid
+        tiempo_a_ejecutar = min(quantum, tiempo_restante[pid])
+        yield ('ejecucion', tiempo_actual, pid, tiempo_a_ejecutar)
+
+        tiempo_actual += tiempo_a_ejecutar
+        tiempo_restante[pid] -= tiempo_a_ejecutar
+
+        for llegado in agregar_procesos_llegados():
+            cola_listos.append(llegado)
+            yield ('llegada', tiempo_actual, llegado.pid)
+
+        if tiempo_restante[pid] > 0:
+            yield ('espera', tiempo_actual, pid, tiempo_restante[pid])
+            cola_listos.append(proceso)
+        else:
+            yield ('fin', tiempo_actual, pid, proceso.arrival_time, proceso.burst_time)
+
+
+def round_robin_event_driven(processes, quantum=2):
+    """
+    Round Robin dirigido por eventos, equivalente a
+    SchedulingAlgorithms.round_robin_scheduling
+
+    Args:
+        processes: Lista de objetos PCB
+        quantum: Tiempo máximo que puede ejecutar cada proceso por turno
+    Returns:
+        tuple: (historial_ejecución, tiempo_total)
+    """
+    historial = []
+    tiempo_actual = 0
+    objetos_proceso = {p.pid: p for p in processes}
+    agregar_evento = SchedulingAlgorithms._agregar_evento
+
+    for evento in _planificar_rr(processes, quantum):
+        tipo, tiempo_actual, pid = evento[0], evento[1], evento[2]
+        obj_proceso = objetos_proceso[pid]
+
+        if tipo == 'llegada':
+            obj_proceso.state = "READY"
+            agregar_evento(historial, tiempo_actual, f'Proceso {pid} → LISTO (llegó a la cola)', pid, 'READY')
+        elif tipo == 'ejecucion':
+            tiempo_a_ejecutar = evento[3]
+            obj_proceso.state = "EXECUTING"
+            obj_proceso.cpu["program_counter"] += tiempo_a_ejecutar
+            obj_proceso.cpu["instruction_pointer"] = tiempo_actual
+            agregar_evento(
+                historial, tiempo_actual,
+                f'Proceso {pid} → EJECUTANDO por {tiempo_a_ejecutar} unidades (quantum={quantum})',
+                pid, 'EXECUTING'
+            )
+        elif tipo == 'espera':
+            obj_proceso.state = "WAITING"
+            agregar_evento(
+                historial, tiempo_actual,
+                f'Proceso {pid} → ESPERANDO (le quedan {evento[3]} unidades)',
+                pid, 'WAITING'
+            )
+        else:
+            arrival_time, burst_time = evento[3], evento[4]
+            obj_proceso.state = "TERMINATED"
+            obj_proceso.completion_time = tiempo_actual
+            obj_proceso.turnaround_time = tiempo_actual - arrival_time
+            obj_proceso.waiting_time = obj_proceso.turnaround_time - burst_time
+            agregar_evento(historial, tiempo_actual, f'Proceso {pid} → TERMINADO', pid, 'TERMINATED')
+
+    return historial, tiempo_actual
+
+
+def rr_timeline_event_driven(processes, quantum):
+    """
+    Timeline de Round Robin dirigido por eventos, equivalente a
+    utils.timeline.generate_execution_timeline(processes, 'rr', quantum)
+    """
+    timeline_data = []
+
+    for evento in _planificar_rr(processes, quantum):
+        if evento[0] == 'ejecucion':
+            _, inicio, pid, duracion = evento
+            timeline_data.extend(
+                {'time': t, 'process': pid, 'state': 'EXECUTING'} for t in range(inicio, inicio + duracion)
+            )
+
+    return timeline_data
+
+
+def non_preemptive_segments(processes):
+    """
+    Segmentos de ejecución de FCFS y SJF a partir de los PCB ya planificados
+
+    Cada proceso con ráfaga se ejecuta de una vez entre start_time y
+    completion_time.
+
+    Returns:
+        list: Lista de tuplas (pid, inicio, fin) en orden de ejecución
+    """
+    ejecutados = sorted(
+        (p for p in processes if p.burst_time > 0 and p.start_time is not None),
+        key=lambda p: p.start_time
+    )
+    segmentos = []
+    for proceso in ejecutados:
+        _agregar_segmento(segmentos, proceso.pid, proceso.start_time, proceso.completion_time)
+    return [tuple(segmento) for segmento in segmentos]
+
+
+def rr_segments_event_driven(processes, quantum):
+    """
+    Segmentos de ejecución de Round Robin a partir de los eventos de ejecución
+
+    Returns:
+        list: Lista de tuplas (pid, inicio, fin) en orden de ejecución
+    """
+    segmentos = []
+    for evento in _planificar_rr(processes, quantum):
+        if evento[0] == 'ejecucion' and evento[3] > 0:
+            _, inicio, pid, duracion = evento
+            _agregar_segmento(segmentos, pid, inicio, inicio + duracion)
+    return [tuple(segmento) for segmento in segmentos]
+
+
+def _agregar_segmento(segmentos, pid, inicio, fin):
+    """Agregar un segmento, uniéndolo al anterior si es del mismo proceso y contiguo"""
+    if segmentos and segmentos[-1][0] == pid and segmentos[-1][2] == inicio:
+        segmentos[-1][2] = fin
+    else:
+        segmentos.append([pid, inicio, fin])
@@ -0,0 +1,337 @@
+"""
+Fuzzing Diferencial de Algoritmos
+=================================
+Genera cargas de trabajo adversarias con una semilla fija, ejecuta todos los
+motores de schedulers.registry (incluidos los de referencia) y compara sus
+resultados contra los algoritmos de referencia (SchedulingAlgorithms +
+timeline actual).
+
+Cuando encuentra una diferencia, reduce la carga de trabajo al caso mínimo
+que sigue fallando.
+
+Uso:
+    python -m schedulers.fuzzing --seed 0 --iterations 500
+    python -m schedulers.fuzzing --module mi_paquete.registro  # motores externos
+"""
+
+import argparse
+import importlib
+import random
+import sys
+
+from models.pcb import PCB
+from schedulers.algorithms import SchedulingAlgorithms
+from schedulers.registry import get_algorithms, get_engines
+from utils.timeline import generate_execution_timeline, timeline_to_segments
+
+
+def _estadisticas(procesos):
+    """Tiempos por proceso que deben coincidir con la referencia"""
+    return {
+        p.pid: {
+            'completion_time': p.completion_time,
+            'waiting_time': p.waiting_time,
+            'turnaround_time': p.turnaround_time,
+        }
+        for p in procesos
+    }
+
+
+def run_engine(motor, workload, quantum):
+    """
+    Ejecutar un motor del registro sobre PCBs nuevos
+
+    Args:
+        motor: SchedulerEngine del registro
+        workload: Lista de tuplas (pid, arrival_time, burst_time)
+        quantum: Quantum de tiempo
+    Returns:
+        dict: 'stats' {pid: tiempos}, 'segments' del motor y
+        'timeline_segments' (su timeline compactado)
+    """
+    procesos = [PCB(pid, arrival_time, burst_time) for pid, arrival_time, burst_time in workload]
+    motor.run(procesos, quantum)
+    return {
+        'stats': _estadisticas(procesos),
+        'segments': motor.segments(procesos, quantum),
+        'timeline_segments': timeline_to_segments(motor.timeline(procesos, quantum)),
+    }
+
+
+# Algoritmo de referencia por nombre: función(procesos, quantum)
+_REFERENCIAS = {
+    'fcfs': lambda procesos, quantum: SchedulingAlgorithms.fcfs_scheduling(procesos),
+    'sjf': lambda procesos, quantum: SchedulingAlgorithms.sjf_scheduling(procesos),
+    'rr': SchedulingAlgorithms.round_robin_scheduling,
+}
+
+
+def reference_engine(algorithm, workload, quantum):
+    """Ejecutar los algoritmos de referencia sobre PCBs nuevos"""
+    referencia = _REFERENCIAS.get(algorithm)
+    if referencia is None:
+        raise ValueError(f'Algoritmo no soportado: {algorithm}')
+
+    procesos = [PCB(pid, arrival_time, burst_time) for pid, arrival_time, burst_time in workload]
+    referencia(procesos, quantum)
+    timeline_data = generate_execution_timeline(procesos, algorithm, quantum)
+
+    return {
+        'stats': _estadisticas(procesos),
+        'segments': timeline_to_segments(timeline_data),
+    }
+
+
+def generate_workload(rng, max_processes=8):
+    """
+    Generar una carga de trabajo adversaria
+
+    Mezcla empates de llegada y ráfaga, ráfagas cero, huecos grandes entre
+    llegadas y ráfagas alrededor del quantum.
+
+    Returns:
+        tuple: (workload, quantum)
+    """
+    quantum = rng.choice([1, 1, 2, 3, rng.randint(1, 10), 100])
+    cantidad = rng.randint(1, max_processes)
+    workload = []
+    llegada = 0
+
+    for indice in range(cantidad):
+        tipo_llegada = rng.random()
+        if tipo_llegada < 0.3:
+            pass  # Empate con la llegada anterior
+        elif tipo_llegada < 0.9:
+            llegada += rng.randint(0, 5)
+        else:
+            llegada += rng.randint(20, 200)  # Hueco grande
+
+        tipo_rafaga = rng.random()
+        if tipo_rafaga < 0.1:
+            rafaga = 0
+        elif tipo_rafaga < 0.4:
+            rafaga = max(0, quantum + rng.choice([-1, 0, 1]))
+        elif tipo_rafaga < 0.5 and workload:
+            rafaga = rng.choice(workload)[2]  # Empate de ráfaga
+        else:
+            rafaga = rng.randint(1, 12)
+
+        workload.append((str(indice + 1), llegada, rafaga))
+
+    # Las llegadas no siempre vienen ordenadas desde la interfaz
+    if rng.random() < 0.5:
+        rng.shuffle(workload)
+
+    return workload, quantum
+
+
+def check_consistency(workload, result):
+    """
+    Verificar que estadísticas y segmentos de un resultado sean coherentes
+
+    Returns:
+        list: Mensajes de error (vacía si es coherente)
+    """
+    errores = []
+    stats, segmentos = result.get('stats'), result.get('segments')
+    if stats is None or segmentos is None:
+        return errores
+
+    ejecutado = {}
+    ultimo_fin = {}
+    for pid, inicio, fin in segmentos:
+        ejecutado[pid] = ejecutado.get(pid, 0) + fin - inicio
+        ultimo_fin[pid] = fin
+
+    for pid, arrival_time, burst_time in workload:
+        if ejecutado.get(pid, 0) != burst_time:
+            errores.append(f'P{pid}: segmentos suman {ejecutado.get(pid, 0)}, ráfaga {burst_time}')
+        if burst_time > 0 and ultimo_fin.get(pid) != stats[pid]['completion_time']:
+            errores.append(
+                f'P{pid}: último segmento termina en {ultimo_fin.get(pid)}, '
+                f'completion_time {stats[pid]["completion_time"]}'
+            )
+        if stats[pid]['turnaround_time'] != stats[pid]['completion_time'] - arrival_time:
+            errores.append(f'P{pid}: turnaround_time inconsistente')
+        if stats[pid]['waiting_time'] != stats[pid]['turnaround_time'] - burst_time:
+            errores.append(f'P{pid}: waiting_time inconsistente')
+
+    return errores
+
+
+def diff_results(expected, actual):
+    """
+    Comparar el resultado de un motor contra la referencia
+
+    Returns:
+        list: Mensajes con cada diferencia (vacía si coinciden)
+    """
+    diferencias = []
+
+    if actual.get('stats') is not None:
+        for pid, esperado in expected['stats'].items():
+            obtenido = actual['stats'].get(pid)
+            if obtenido is None:
+                diferencias.append(f'P{pid}: falta en el resultado')
+                continue
+            for campo, valor in esperado.items():
+                if obtenido.get(campo) != valor:
+                    diferencias.append(f'P{pid}: {campo} esperado {valor}, obtenido {obtenido.get(campo)}')
+
+    if actual.get('segments') is not None and list(actual['segments']) != expected['segments']:
+        diferencias.append(
+            f'segmentos: esperado {expected["segments"]}, obtenido {list(actual["segments"])}'
+        )
+    if actual.get('timeline_segments') is not None and actual['timeline_segments'] != expected['segments']:
+        diferencias.append(
+            f'timeline: esperado {expected["segments"]}, obtenido {actual["timeline_segments"]}'
+        )
+
+    return diferencias
+
+
+def find_failures(algorithm, workload, quantum):
+    """
+    Ejecutar todos los motores registrados de un algoritmo sobre una carga de trabajo
+
+    Returns:
+        list: Mensajes de fallo, prefijados con el nombre del motor
+    """
+    referencia = reference_engine(algorithm, workload, quantum)
+    fallos = [f'reference: {error}' for error in check_consistency(workload, referencia)]
+
+    for motor in get_engines(algorithm):
+        if not motor.is_available():
+            continue
+        try:
+            resultado = run_engine(motor, workload, quantum)
+        except Exception as e:
+            fallos.append(f'{motor.name}: excepción {type(e).__name__}: {e}')
+            continue
+        fallos.extend(f'{motor.name}: {error}' for error in check_consistency(workload, resultado))
+        fallos.extend(f'{motor.name}: {error}' for error in diff_results(referencia, resultado))
+
+    return fallos
+
+
+def shrink(algorithm, workload, quantum):
+    """
+    Reducir una carga de trabajo que falla al caso mínimo que sigue fallando
+
+    Prueba eliminar procesos, acercar llegadas y ráfagas a cero y reducir el
+    quantum, aceptando cada cambio solo si el fallo persiste.
+
+    Returns:
+        tuple: (workload, quantum) mínimos
+    """
+    def falla(candidato, q):
+        return bool(find_failures(algorithm, candidato, q))
+
+    mejorado = True
+    while mejorado:
+        mejorado = False
+
+        # Eliminar procesos
+        for indice in range(len(workload)):
+            candidato = workload[:indice] + workload[indice + 1:]
+            if candidato and falla(candidato, quantum):
+                workload, mejorado = candidato, True
+                break
+        if mejorado:
+            continue
+
+        # Reducir llegadas y ráfagas
+        for indice, (pid, arrival_time, burst_time) in enumerate(workload):
+            for nuevo in (
+                (pid, 0, burst_time), (pid, arrival_time // 2, burst_time), (pid, arrival_time - 1, burst_time),
+                (pid, arrival_time, 0), (pid, arrival_time, burst_time // 2), (pid, arrival_time, burst_time - 1),
+            ):
+                if nuevo[1] < 0 or nuevo[2] < 0 or nuevo == workload[indice]:
+                    continue
+                candidato = workload[:indice] + [nuevo] + workload[indice + 1:]
+                if falla(candidato, quantum):
+                    workload, mejorado = candidato, True
+                    break
+            if mejorado:
+                break
+        if mejorado:
+            continue
+
+        # Reducir quantum
+        for q in (1, quantum // 2, quantum - 1):
+            if 1 <= q < quantum and falla(workload, q):
+                quantum, mejorado = q, True
+                break
+
+    return workload, quantum
+
+
+def run_fuzzing(seed=0, iterations=200, algorithms=None, max_processes=8):
+    """
+    Ejecutar la campaña de fuzzing diferencial
+
+    Args:
+        seed: Semilla del generador (misma semilla, mismas cargas)
+        iterations: Número de cargas de trabajo por algoritmo
+        algorithms: Algoritmos a probar (por defecto todos)
+        max_processes: Máximo de procesos por carga de trabajo
+
+    Returns:
+        list: Fallos mínimos encontrados, cada uno como diccionario con
+        'algorithm', 'seed', 'iteration', 'workload', 'quantum' y 'errors'
+    """
+    fallos = []
+
+    for algorithm in algorithms or get_algorithms():
+        rng = random.Random(f'{seed}-{algorithm}')
+        for iteracion in range(iterations):
+            workload, quantum = generate_workload(rng, max_processes)
+            if not find_failures(algorithm, workload, quantum):
+                continue
+
+            workload, quantum = shrink(algorithm, workload, quantum)
+            fallos.append({
+                'algorithm': algorithm,
+                'seed': seed,
+                'iteration': iteracion,
+                'workload': workload,
+                'quantum': quantum,
+                'errors': find_failures(algorithm, workload, quantum),
+            })
+
+    return fallos
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos"""
+    # Importar primero los módulos que registran motores externos, para que
+    # sus algoritmos y motores existan antes de construir las opciones
+    modulos = argparse.ArgumentParser(add_help=False)
+    modulos.add_argument('--module', action='append', default=[],
+                         help='Módulo a importar antes de probar (registra motores externos)')
+    for modulo in modulos.parse_known_args(argv)[0].module:
+        importlib.import_module(modulo)
+
+    parser = argparse.ArgumentParser(description='Fuzzing diferencial de algoritmos de planificación',
+                                     parents=[modulos])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--algorithm', choices=get_algorithms(), action='append')
+    parser.add_argument('--max-processes', type=int, default=8)
+    args = parser.parse_args(argv)
+
+    fallos = run_fuzzing(args.seed, args.iterations, args.algorithm, args.max_processes)
+
+    for fallo in fallos:
+        print(f"[{fallo['algorithm']}] semilla={fallo['seed']} iteración={fallo['iteration']} "
+              f"quantum={fallo['quantum']} procesos={fallo['workload']}")
+        for error in fallo['errors']:
+            print(f'    {error}')
+
+    motores = sum(motor.is_available() for motor in get_engines())
+    print(f'{len(fallos)} fallos ({motores} motores registrados, {args.iterations} cargas por algoritmo)')
+    return 1 if fallos else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,7 +4,8 @@ Contiene la clase principal para manejar la planificación de procesos.
 """
 
 from models.pcb import PCB
-from schedulers.algorithms import SchedulingAlgorithms
+from schedulers.registry import select_engine
+from utils.export import export_results
 
 class ProcessScheduler:
     """Simulador de planificación de procesos"""
@@ -15,6 +16,9 @@ class ProcessScheduler:
         self.current_process = None
         self.current_time = 0
         self.execution_log = []
+        self.algorithm = None  # Último algoritmo ejecutado ('fcfs', 'sjf', 'rr')
+        self.quantum = None
+        self.engine = None  # Motor del registro usado en la última ejecución
         
     def add_process(self, pid, arrival_time, burst_time, priority=0):
         """
@@ -36,22 +40,47 @@ class ProcessScheduler:
         self.current_process = None
         self.current_time = 0
         self.execution_log = []
+        self.algorithm = None
+        self.quantum = None
+        self.engine = None
         
-    def fcfs_scheduling(self):
+    def run(self, algorithm, quantum=None, engine=None, require=()):
         """
-        Ejecutar algoritmo First Come First Served
+        Ejecutar un algoritmo usando el motor más adecuado del registro
         
+        Args:
+            algorithm: Algoritmo a ejecutar ('fcfs', 'sjf', 'rr')
+            quantum: Quantum de tiempo (solo algoritmos expropiativos)
+            engine: Nombre de un motor concreto (opcional)
+            require: Capacidades que el motor debe tener (opcional)
+            
         Returns:
             list: Log de ejecución del algoritmo
         """
+        motor = select_engine(algorithm, len(self.processes), engine, require)
+        if motor.preemptive and quantum is None:
+            quantum = 2
+        
         self.current_time = 0
         self.execution_log = []
         
-        execution_log, self.current_time = SchedulingAlgorithms.fcfs_scheduling(self.processes)
+        execution_log, self.current_time = motor.run(self.processes, quantum)
         self.execution_log = execution_log
+        self.algorithm = algorithm
+        self.quantum = quantum if motor.preemptive else None
+        self.engine = motor
         
         return self.execution_log
     
+    def fcfs_scheduling(self):
+        """
+        Ejecutar algoritmo First Come First Served
+        
+        Returns:
+            list: Log de ejecución del algoritmo
+        """
+        return self.run('fcfs')
+    
     def sjf_scheduling(self):
         """
         Ejecutar algoritmo Shortest Job First
@@ -59,13 +88,7 @@ class ProcessScheduler:
         Returns:
             list: Log de ejecución del algoritmo
         """
-        self.current_time = 0
-        self.execution_log = []
-        
-        execution_log, self.current_time = SchedulingAlgorithms.sjf_scheduling(self.processes)
-        self.execution_log = execution_log
-        
-        return self.execution_log
+        return self.run('sjf')
     
     def round_robin_scheduling(self, quantum=2):
         """
@@ -77,13 +100,7 @@ class ProcessScheduler:
         Returns:
             list: Log de ejecución del algoritmo
         """
-        self.current_time = 0
-        self.execution_log = []
-        
-        execution_log, self.current_time = SchedulingAlgorithms.round_robin_scheduling(self.processes, quantum)
-        self.execution_log = execution_log
-        
-        return self.execution_log
+        return self.run('rr', quantum)
     
     def get_process_stats(self):
         """
@@ -122,6 +139,44 @@ class ProcessScheduler:
             
         return pcb_data
     
+    def get_timeline_data(self):
+        """
+        Obtener el timeline de animación de la última ejecución
+        
+        Returns:
+            list: Timeline de datos para animación
+        """
+        if self.engine is None:
+            return []
+        return self.engine.timeline(self.processes, self.quantum)
+    
+    def get_segments(self):
+        """
+        Obtener los segmentos de ejecución de la última ejecución
+        
+        Returns:
+            list: Lista de tuplas (pid, inicio, fin)
+        """
+        if self.engine is None:
+            return []
+        return self.engine.segments(self.processes, self.quantum)
+    
+    def export_results(self, directory, format='npy'):
+        """
+        Exportar estadísticas y segmentos de ejecución en formato columnar
+        
+        Args:
+            directory: Directorio de destino
+            format: 'npy', 'npz', 'arrow' o 'parquet' (Arrow y Parquet requieren pyarrow)
+            
+        Returns:
+            dict: {nombre_tabla: ruta_del_archivo}
+        """
+        if self.algorithm is None:
+            raise ValueError('No hay resultados para exportar: ejecute un algoritmo primero')
+        
+        return export_results(self.get_process_stats(), self.get_segments(), directory, format)
+    
     def get_process_count(self):
         """Obtener el número de procesos en el scheduler"""
         return len(self.processes)
@@ -0,0 +1,230 @@
+"""
+Registro de Planificadores
+==========================
+Cada algoritmo ('fcfs', 'sjf', 'rr') puede tener varios motores registrados.
+Los motores declaran sus capacidades y el tamaño de carga a partir del cual
+conviene usarlos; select_engine elige el más adecuado para cada petición.
+
+Los motores pueden registrarse con rutas 'modulo:funcion' para que su
+módulo (y dependencias pesadas como numpy) solo se importe al usarlos.
+"""
+
+import importlib
+import importlib.util
+
+from schedulers.algorithms import SchedulingAlgorithms
+from utils.timeline import generate_execution_timeline, timeline_to_segments
+
+# Capacidades reconocidas
+CAPACIDADES = ('preemptive', 'vectorizable', 'streaming', 'event_driven')
+
+
+class AlgoritmoNoSoportado(ValueError):
+    """Error al seleccionar un algoritmo o motor que no existe o no está disponible"""
+
+
+class SchedulerEngine:
+    """Motor de planificación registrado para un algoritmo"""
+
+    def __init__(self, name, algorithm, run, timeline, capabilities=(),
+                 min_processes=0, requires=(), description='', segments=None):
+        """
+        Args:
+            name: Nombre único del motor dentro del algoritmo
+            algorithm: Algoritmo que implementa ('fcfs', 'sjf', 'rr')
+            run: Función(processes[, quantum]) -> (historial, tiempo_total),
+                 o ruta 'modulo:funcion' para importarla de forma perezosa
+            timeline: Función(processes[, quantum]) -> timeline_data, o ruta
+            capabilities: Capacidades declaradas (ver CAPACIDADES)
+            min_processes: Número de procesos a partir del cual se prefiere
+            requires: Paquetes opcionales necesarios (p. ej. ('numpy',))
+            description: Texto descriptivo
+            segments: Función(processes[, quantum]) -> [(pid, inicio, fin)], o
+                 ruta; si se omite, se compacta el timeline
+        """
+        desconocidas = set(capabilities) - set(CAPACIDADES)
+        if desconocidas:
+            raise ValueError(f'Capacidades no soportadas: {", ".join(sorted(desconocidas))}')
+
+        self.name = name
+        self.algorithm = algorithm
+        self.capabilities = frozenset(capabilities)
+        self.min_processes = min_processes
+        self.requires = tuple(requires)
+        self.description = description
+        self._run = run
+        self._timeline = timeline
+        self._segments = segments
+        self._available = None
+
+    @property
+    def preemptive(self):
+        """Los motores expropiativos reciben el quantum"""
+        return 'preemptive' in self.capabilities
+
+    def is_available(self):
+        """Comprobar si las dependencias opcionales están instaladas, sin importarlas"""
+        if self._available is None:
+            self._available = all(importlib.util.find_spec(modulo) is not None for modulo in self.requires)
+        return self._available
+
+    def run(self, processes, quantum=None):
+        """Ejecutar el algoritmo sobre los PCB"""
+        self._run = _resolver(self._run)
+        return self._run(processes, quantum) if self.preemptive else self._run(processes)
+
+    def timeline(self, processes, quantum=None):
+        """Generar el timeline de animación para los PCB"""
+        self._timeline = _resolver(self._timeline)
+        return self._timeline(processes, quantum) if self.preemptive else self._timeline(processes)
+
+    def segments(self, processes, quantum=None):
+        """Obtener los segmentos de ejecución (pid, inicio, fin) de los PCB ya planificados"""
+        if self._segments is None:
+            return timeline_to_segments(self.timeline(processes, quantum))
+        self._segments = _resolver(self._segments)
+        return self._segments(processes, quantum) if self.preemptive else self._segments(processes)
+
+    def to_dict(self):
+        """Convertir el motor a diccionario para serialización JSON"""
+        return {
+            'name': self.name,
+            'algorithm': self.algorithm,
+            'capabilities': sorted(self.capabilities),
+            'min_processes': self.min_processes,
+            'requires': list(self.requires),
+            'available': self.is_available(),
+            'description': self.description,
+        }
+
+    def __repr__(self):
+        return f"SchedulerEngine(algorithm={self.algorithm}, name={self.name})"
+
+
+# algoritmo -> lista de motores, ordenada de mayor a menor min_processes
+_MOTORES = {}
+
+
+def register_scheduler(engine):
+    """
+    Registrar un motor de planificación
+
+    Args:
+        engine: Instancia de SchedulerEngine
+    Returns:
+        SchedulerEngine: El mismo motor registrado
+    """
+    motores = _MOTORES.setdefault(engine.algorithm, [])
+    if any(motor.name == engine.name for motor in motores):
+        raise ValueError(f'Motor ya registrado para {engine.algorithm}: {engine.name}')
+
+    motores.append(engine)
+    # Ordenar una sola vez al registrar para que la selección sea un recorrido lineal
+    motores.sort(key=lambda motor: motor.min_processes, reverse=True)
+    return engine
+
+
+def get_algorithms():
+    """Obtener los nombres de los algoritmos registrados"""
+    return list(_MOTORES)
+
+
+def get_engines(algorithm=None):
+    """
+    Obtener los motores registrados
+
+    Args:
+        algorithm: Filtrar por algoritmo (opcional)
+    Returns:
+        list: Lista de SchedulerEngine
+    """
+    if algorithm is not None:
+        return list(_MOTORES.get(algorithm, []))
+    return [motor for motores in _MOTORES.values() for motor in motores]
+
+
+def select_engine(algorithm, process_count=0, engine=None, require=()):
+    """
+    Elegir el motor más rápido para un algoritmo y tamaño de carga
+
+    Args:
+        algorithm: Algoritmo solicitado
+        process_count: Número de procesos de la carga
+        engine: Nombre de un motor concreto (opcional)
+        require: Capacidades que el motor debe tener
+    Returns:
+        SchedulerEngine: Motor seleccionado
+    Raises:
+        AlgoritmoNoSoportado: Si ningún motor cumple la petición
+    """
+    if algorithm not in _MOTORES:
+        raise AlgoritmoNoSoportado(f'Algoritmo no soportado: {algorithm}')
+    if engine is not None and not isinstance(engine, str):
+        raise AlgoritmoNoSoportado('engine debe ser el nombre de un motor')
+    if not isinstance(require, (list, tuple, set, frozenset)) or not all(isinstance(c, str) for c in require):
+        raise AlgoritmoNoSoportado(f'require debe ser una lista de capacidades ({", ".join(CAPACIDADES)})')
+    desconocidas = set(require) - set(CAPACIDADES)
+    if desconocidas:
+        raise AlgoritmoNoSoportado(f'Capacidades no soportadas: {", ".join(sorted(desconocidas))}')
+
+    requeridas = frozenset(require)
+    alternativo = None
+    for motor in _MOTORES[algorithm]:
+        if engine is not None and motor.name != engine:
+            continue
+        if not requeridas <= motor.capabilities or not motor.is_available():
+            continue
+        if motor.min_processes <= process_count:
+            return motor
+        # min_processes es una preferencia: si ninguno aplica, usar el de menor umbral
+        alternativo = motor
+
+    if alternativo is not None:
+        return alternativo
+    if engine is not None:
+        raise AlgoritmoNoSoportado(f'Motor no disponible para {algorithm}: {engine}')
+    raise AlgoritmoNoSoportado(f'Ningún motor de {algorithm} cumple: {", ".join(sorted(requeridas))}')
+
+
+def _resolver(funcion):
+    """Importar una función registrada como 'modulo:funcion' la primera vez que se usa"""
+    if not isinstance(funcion, str):
+        return funcion
+    modulo, _, nombre = funcion.partition(':')
+    return getattr(importlib.import_module(modulo), nombre)
+
+
+# Motores de referencia
+register_scheduler(SchedulerEngine(
+    'reference', 'fcfs',
+    SchedulingAlgorithms.fcfs_scheduling,
+    lambda processes: generate_execution_timeline(processes, 'fcfs'),
+    description='First Come First Served',
+    segments='schedulers.fast_algorithms:non_preemptive_segments'
+))
+register_scheduler(SchedulerEngine(
+    'reference', 'sjf',
+    SchedulingAlgorithms.sjf_scheduling,
+    lambda processes: generate_execution_timeline(processes, 'sjf'),
+    description='Shortest Job First (por lotes)',
+    segments='schedulers.fast_algorithms:non_preemptive_segments'
+))
+register_scheduler(SchedulerEngine(
+    'reference', 'rr',
+    SchedulingAlgorithms.round_robin_scheduling,
+    lambda processes, quantum: generate_execution_timeline(processes, 'rr', quantum),
+    capabilities=('preemptive',),
+    description='Round Robin',
+    segments='schedulers.fast_algorithms:rr_segments_event_driven'
+))
+
+# Motores optimizados (se importan al usarlos por primera vez)
+register_scheduler(SchedulerEngine(
+    'event_driven', 'rr',
+    'schedulers.fast_algorithms:round_robin_event_driven',
+    'schedulers.fast_algorithms:rr_timeline_event_driven',
+    capabilities=('preemptive', 'event_driven'),
+    min_processes=50,
+    description='Round Robin dirigido por eventos con cola deque y salto de tiempos ociosos',
+    segments='schedulers.fast_algorithms:rr_segments_event_driven'
+))
@@ -0,0 +1,102 @@
+"""Pruebas de la exportación columnar de resultados"""
+
+import io
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from app import app
+from schedulers import ProcessScheduler
+from utils import load_table
+from utils.export import VALOR_NULO, build_columns, write_table
+
+PROCESOS = [
+    {'pid': '1', 'arrival_time': 0, 'burst_time': 5},
+    {'pid': '2', 'arrival_time': 1, 'burst_time': 3},
+]
+
+
+def _scheduler(procesos, algorithm='fcfs', quantum=None):
+    scheduler = ProcessScheduler()
+    for pid, arrival_time, burst_time in procesos:
+        scheduler.add_process(pid, arrival_time, burst_time)
+    scheduler.run(algorithm, quantum)
+    return scheduler
+
+
+def test_fractional_times_are_exported_as_float64(tmp_path):
+    scheduler = _scheduler([('1', 1.5, 2), ('2', 0, 1)])
+    rutas = scheduler.export_results(str(tmp_path), 'npy')
+    stats = load_table(rutas['process_stats'])
+
+    assert stats['arrival_time'].dtype == np.float64
+    assert stats['burst_time'].dtype == np.int64
+    assert list(stats['completion_time']) == [3.5, 1]
+    assert list(stats['turnaround_time']) == [2.0, 1]
+
+
+def test_unknown_times_use_null_value():
+    scheduler = _scheduler([('1', 0, 3)], 'rr', 2)
+    columnas = build_columns(scheduler.get_process_stats(), scheduler.get_segments())
+
+    # Round Robin no registra start_time
+    assert columnas['process_stats']['start_time'] == [VALOR_NULO]
+
+
+def test_npy_round_trip_is_memory_mapped(tmp_path):
+    scheduler = _scheduler([('1', 0, 3), ('2', 1, 2)], 'rr', 1)
+    rutas = scheduler.export_results(str(tmp_path))
+
+    segmentos = load_table(rutas['segments'])
+    assert isinstance(segmentos['start'], np.memmap)
+    assert list(zip(segmentos['pid'], segmentos['start'], segmentos['end'])) == scheduler.get_segments()
+    assert not isinstance(load_table(rutas['segments'], mmap=False)['start'], np.memmap)
+
+
+def test_npz_loads_lazily_by_default(tmp_path):
+    scheduler = _scheduler([('1', 0, 3), ('2', 1, 2)])
+    rutas = scheduler.export_results(str(tmp_path), 'npz')
+
+    assert list(load_table(rutas['process_stats'])['pid']) == ['1', '2']
+    with pytest.raises(ValueError):
+        load_table(rutas['process_stats'], mmap=True)
+
+
+@pytest.mark.parametrize('format', ['arrow', 'parquet'])
+def test_arrow_and_parquet_round_trip(tmp_path, format):
+    pytest.importorskip('pyarrow')
+    scheduler = _scheduler([('1', 0, 3), ('2', 1.5, 2)], 'sjf')
+    rutas = scheduler.export_results(str(tmp_path), format)
+
+    stats = load_table(rutas['process_stats']).to_pydict()
+    assert stats['pid'] == ['1', '2']
+    assert stats['waiting_time'] == [p['waiting_time'] for p in scheduler.get_process_stats()]
+    segmentos = load_table(rutas['segments']).to_pydict()
+    assert list(zip(segmentos['pid'], segmentos['start'], segmentos['end'])) == scheduler.get_segments()
+
+
+def test_write_table_to_file_object():
+    columnas = {'pid': ['1'], 'start': [0], 'end': [2]}
+    archivo = io.BytesIO()
+    write_table(columnas, archivo, 'npz')
+    archivo.seek(0)
+
+    assert list(np.load(archivo)['end']) == [2]
+
+
+def test_export_endpoint_returns_file():
+    respuesta = app.test_client().post('/export', json={
+        'processes': PROCESOS, 'algorithm': 'rr', 'quantum': 2, 'format': 'npz', 'table': 'segments'
+    })
+
+    assert respuesta.status_code == 200
+    segmentos = np.load(io.BytesIO(respuesta.data))
+    assert list(segmentos['pid']) == ['1', '2', '1', '2', '1']
+
+
+@pytest.mark.parametrize('cambios', [{'format': 'npy'}, {'format': 'csv'}, {'table': 'pcb'}])
+def test_export_endpoint_rejects_invalid_options(cambios):
+    respuesta = app.test_client().post('/export', json=dict({'processes': PROCESOS, 'algorithm': 'fcfs'}, **cambios))
+
+    assert respuesta.status_code == 400
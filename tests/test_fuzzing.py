@@ -0,0 +1,37 @@
+"""Pruebas del fuzzing diferencial: los motores registrados coinciden con la referencia y las divergencias se detectan"""
+
+from schedulers import registry
+from schedulers.fast_algorithms import round_robin_event_driven, rr_timeline_event_driven
+from schedulers.fuzzing import run_fuzzing
+from schedulers.registry import SchedulerEngine
+
+
+def test_registered_engines_match_reference():
+    assert run_fuzzing(seed=0, iterations=200) == []
+
+
+def test_registered_engines_match_reference_on_larger_workloads():
+    assert run_fuzzing(seed=1, iterations=50, max_processes=60) == []
+
+
+def test_divergent_engine_is_reported_and_shrunk(monkeypatch):
+    def completion_incorrecto(processes, quantum):
+        historial = round_robin_event_driven(processes, quantum)
+        for proceso in processes:
+            if proceso.burst_time == 0:
+                proceso.completion_time += 1
+        return historial
+
+    motor = SchedulerEngine(
+        'incorrecto', 'rr', completion_incorrecto, rr_timeline_event_driven, capabilities=('preemptive',)
+    )
+    monkeypatch.setitem(registry._MOTORES, 'rr', [motor])
+
+    fallos = run_fuzzing(seed=0, iterations=50, algorithms=['rr'])
+
+    assert fallos
+    for fallo in fallos:
+        assert len(fallo['workload']) == 1
+        assert fallo['workload'][0][1:] == (0, 0)
+        assert fallo['quantum'] == 1
+        assert any('incorrecto: ' in error and 'completion_time' in error for error in fallo['errors'])
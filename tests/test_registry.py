@@ -0,0 +1,86 @@
+"""Pruebas del registro de planificadores y de la selección de motores"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app import app
+from schedulers import registry
+from schedulers.registry import AlgoritmoNoSoportado, get_engines, select_engine
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _procesos(cantidad):
+    return [{'pid': str(i), 'arrival_time': i % 7, 'burst_time': 1 + i % 4} for i in range(cantidad)]
+
+
+def test_select_engine_by_workload_size():
+    assert select_engine('rr', 49).name == 'reference'
+    assert select_engine('rr', 50).name == 'event_driven'
+    assert select_engine('fcfs', 10000).name == 'reference'
+
+
+def test_select_engine_falls_back_when_no_threshold_applies(monkeypatch):
+    # Con capacidades requeridas, el umbral es solo una preferencia
+    assert select_engine('rr', 2, require=['event_driven']).name == 'event_driven'
+
+    solo_rapido = [motor for motor in get_engines('rr') if motor.name == 'event_driven']
+    monkeypatch.setitem(registry._MOTORES, 'rr', solo_rapido)
+    assert select_engine('rr', 1).name == 'event_driven'
+
+
+@pytest.mark.parametrize('argumentos', [
+    {'algorithm': 'lottery'},
+    {'algorithm': 'rr', 'engine': 'inexistente'},
+    {'algorithm': 'rr', 'engine': ['event_driven']},
+    {'algorithm': 'rr', 'require': ['turbo']},
+    {'algorithm': 'rr', 'require': 'preemptive'},
+    {'algorithm': 'fcfs', 'require': ['streaming']},
+])
+def test_select_engine_rejects_invalid_requests(argumentos):
+    with pytest.raises(AlgoritmoNoSoportado):
+        select_engine(**argumentos)
+
+
+def test_simulate_reports_selected_engine():
+    cliente = app.test_client()
+
+    pequeno = cliente.post('/simulate', json={'processes': _procesos(3), 'algorithm': 'rr', 'quantum': 2})
+    grande = cliente.post('/simulate', json={'processes': _procesos(60), 'algorithm': 'rr', 'quantum': 2})
+    forzado = cliente.post('/simulate', json={
+        'processes': _procesos(60), 'algorithm': 'rr', 'quantum': 2, 'engine': 'reference', 'require': None
+    })
+
+    assert pequeno.get_json()['engine'] == 'reference'
+    assert grande.get_json()['engine'] == 'event_driven'
+    assert forzado.get_json()['engine'] == 'reference'
+    for clave in ('execution_log', 'process_stats', 'timeline_data', 'pcb_data'):
+        assert grande.get_json()[clave] == forzado.get_json()[clave]
+
+
+def test_simulate_rejects_invalid_options():
+    cliente = app.test_client()
+    base = {'processes': _procesos(3), 'algorithm': 'rr'}
+
+    for cambios in ({'algorithm': 'x'}, {'engine': 'x'}, {'engine': ['x']}, {'require': 'preemptive'}):
+        respuesta = cliente.post('/simulate', json=dict(base, **cambios))
+        assert respuesta.status_code == 400
+
+
+def test_engines_endpoint_lists_registry():
+    motores = app.test_client().get('/engines').get_json()
+
+    assert {(m['algorithm'], m['name']) for m in motores} == {(m.algorithm, m.name) for m in get_engines()}
+
+
+def test_app_import_does_not_load_optional_engines():
+    codigo = (
+        'import sys, app; '
+        'print(any(m in sys.modules for m in ("schedulers.fast_algorithms", "numpy", "pyarrow")))'
+    )
+    salida = subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ, capture_output=True, text=True, check=True)
+
+    assert salida.stdout.strip() == 'False'
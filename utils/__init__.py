@@ -1,5 +1,6 @@
 """Módulo utils - Contiene funciones de utilidad"""
 
-from .timeline import generate_execution_timeline
+from .timeline import generate_execution_timeline, timeline_to_segments
+from .export import export_results, load_table, DependenciaNoInstalada, FORMATOS_EXPORTACION, FORMATOS_ARCHIVO
 
-__all__ = ['generate_execution_timeline']
\ No newline at end of file
+__all__ = ['generate_execution_timeline', 'timeline_to_segments', 'export_results', 'load_table', 'DependenciaNoInstalada', 'FORMATOS_EXPORTACION', 'FORMATOS_ARCHIVO']
\ No newline at end of file
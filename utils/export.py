@@ -0,0 +1,201 @@
+"""
+Módulo Export
+Contiene funciones para exportar los resultados de la simulación en formatos
+binarios columnares (NPY, NPZ, Arrow, Parquet) y volver a leerlos sin pasar por JSON.
+"""
+
+import os
+
+# Formatos soportados y la extensión de archivo de cada uno
+# ('npy' escribe un directorio por tabla con un archivo .npy por columna)
+FORMATOS_EXPORTACION = {
+    'npy': '',
+    'npz': '.npz',
+    'arrow': '.arrow',
+    'parquet': '.parquet',
+}
+
+# Formatos que producen un único archivo (descargables desde /export)
+FORMATOS_ARCHIVO = ('npz', 'arrow', 'parquet')
+
+# Tablas exportadas: nombre -> columnas en orden
+TABLAS_EXPORTACION = {
+    'process_stats': (
+        'pid', 'arrival_time', 'burst_time', 'start_time',
+        'completion_time', 'turnaround_time', 'waiting_time', 'state'
+    ),
+    'segments': ('pid', 'start', 'end'),
+}
+
+# Columnas de texto; el resto se guarda como enteros de 64 bits, o como
+# flotantes de 64 bits si la columna contiene algún tiempo fraccionario
+_COLUMNAS_TEXTO = ('pid', 'state')
+
+# Valor usado para tiempos que aún no se conocen (None)
+VALOR_NULO = -1
+
+
+class DependenciaNoInstalada(RuntimeError):
+    """Error cuando un formato requiere un paquete opcional que no está instalado"""
+
+
+def build_columns(process_stats, segments):
+    """
+    Convertir estadísticas y segmentos de ejecución en columnas listas para exportar
+
+    Args:
+        process_stats: Lista devuelta por ProcessScheduler.get_process_stats
+        segments: Lista de tuplas (pid, inicio, fin), p. ej. ProcessScheduler.get_segments
+
+    Returns:
+        dict: {nombre_tabla: {columna: lista_de_valores}}
+    """
+    estadisticas = {columna: [] for columna in TABLAS_EXPORTACION['process_stats']}
+    for stat in process_stats:
+        for columna in estadisticas:
+            valor = stat.get(columna)
+            if columna in _COLUMNAS_TEXTO:
+                estadisticas[columna].append(str(valor))
+            else:
+                estadisticas[columna].append(VALOR_NULO if valor is None else valor)
+
+    segmentos = {columna: [] for columna in TABLAS_EXPORTACION['segments']}
+    for pid, inicio, fin in segments:
+        segmentos['pid'].append(str(pid))
+        segmentos['start'].append(inicio)
+        segmentos['end'].append(fin)
+
+    return {'process_stats': estadisticas, 'segments': segmentos}
+
+
+def write_table(columns, destination, format='npz'):
+    """
+    Escribir una tabla en formato columnar
+
+    Args:
+        columns: Diccionario {columna: lista_de_valores}
+        destination: Ruta o archivo binario abierto para escritura
+            (para 'npy', ruta del directorio de la tabla)
+        format: 'npy', 'npz', 'arrow' o 'parquet'
+    """
+    if format in ('npy', 'npz'):
+        np = _importar('numpy', format)
+        arreglos = {
+            columna: np.asarray(valores, dtype=_tipo_columna(columna, valores, str, np.int64, np.float64))
+            for columna, valores in columns.items()
+        }
+        if format == 'npz':
+            np.savez(destination, **arreglos)
+            return
+        if not isinstance(destination, str):
+            raise ValueError('El formato npy requiere la ruta de un directorio')
+        os.makedirs(destination, exist_ok=True)
+        for columna, arreglo in arreglos.items():
+            np.save(os.path.join(destination, columna + '.npy'), arreglo)
+    elif format in ('arrow', 'parquet'):
+        pa = _importar('pyarrow', format)
+        tabla = pa.table({
+            columna: pa.array(valores, type=_tipo_columna(columna, valores, pa.string(), pa.int64(), pa.float64()))
+            for columna, valores in columns.items()
+        })
+        if format == 'arrow':
+            with pa.ipc.new_file(destination, tabla.schema) as writer:
+                writer.write_table(tabla)
+        else:
+            import pyarrow.parquet as pq
+            pq.write_table(tabla, destination)
+    else:
+        raise ValueError(f'Formato de exportación no soportado: {format}')
+
+
+def export_results(process_stats, segments, directory, format='npy'):
+    """
+    Exportar estadísticas por proceso y segmentos de ejecución a un directorio
+
+    Se escribe un archivo por tabla: process_stats.<ext> y segments.<ext>
+    (con 'npy', un subdirectorio por tabla con un .npy por columna).
+
+    Args:
+        process_stats: Lista devuelta por ProcessScheduler.get_process_stats
+        segments: Lista de tuplas (pid, inicio, fin)
+        directory: Directorio de destino (se crea si no existe)
+        format: 'npy', 'npz', 'arrow' o 'parquet'
+
+    Returns:
+        dict: {nombre_tabla: ruta_del_archivo}
+    """
+    if format not in FORMATOS_EXPORTACION:
+        raise ValueError(f'Formato de exportación no soportado: {format}')
+
+    os.makedirs(directory, exist_ok=True)
+    rutas = {}
+
+    for nombre, columnas in build_columns(process_stats, segments).items():
+        ruta = os.path.join(directory, nombre + FORMATOS_EXPORTACION[format])
+        write_table(columnas, ruta, format)
+        rutas[nombre] = ruta
+
+    return rutas
+
+
+def load_table(path, mmap=None):
+    """
+    Leer una tabla exportada con write_table
+
+    Por defecto (mmap=None) las tablas NPY, Arrow y Parquet se abren
+    mapeadas en memoria y los NPZ se cargan de forma perezosa columna a
+    columna. Los NPZ no admiten mapeo en memoria: pedirlo explícitamente
+    con mmap=True lanza ValueError.
+
+    Args:
+        path: Directorio de una tabla NPY o archivo .npz, .arrow o .parquet
+        mmap: True para exigir mapeo en memoria, False para no usarlo,
+            None para usarlo cuando el formato lo permita
+
+    Returns:
+        dict {columna: numpy.ndarray} (NPY), NpzFile (NPZ) o pyarrow.Table
+    """
+    if os.path.isdir(path):
+        np = _importar('numpy', 'npy')
+        return {
+            os.path.splitext(archivo)[0]: np.load(os.path.join(path, archivo), mmap_mode=None if mmap is False else 'r')
+            for archivo in sorted(os.listdir(path))
+            if archivo.endswith('.npy')
+        }
+
+    extension = os.path.splitext(path)[1]
+
+    if extension == FORMATOS_EXPORTACION['npz']:
+        if mmap is True:
+            raise ValueError('Los archivos NPZ no admiten mapeo en memoria: use el formato npy')
+        np = _importar('numpy', 'npz')
+        return np.load(path)
+    if extension == FORMATOS_EXPORTACION['arrow']:
+        pa = _importar('pyarrow', 'arrow')
+        if mmap is not False:
+            return pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+        with pa.OSFile(path, 'rb') as fuente:
+            return pa.ipc.open_file(fuente).read_all()
+    if extension == FORMATOS_EXPORTACION['parquet']:
+        _importar('pyarrow', 'parquet')
+        import pyarrow.parquet as pq
+        return pq.read_table(path, memory_map=mmap is not False)
+
+    raise ValueError(f'Extensión de archivo no soportada: {extension}')
+
+
+def _tipo_columna(columna, valores, texto, entero, flotante):
+    """Elegir el tipo de una columna sin perder tiempos fraccionarios"""
+    if columna in _COLUMNAS_TEXTO:
+        return texto
+    if any(isinstance(valor, float) for valor in valores):
+        return flotante
+    return entero
+
+
+def _importar(modulo, format):
+    """Importar una dependencia opcional solo cuando se necesita"""
+    try:
+        return __import__(modulo)
+    except ImportError:
+        raise DependenciaNoInstalada(f'El formato {format} requiere el paquete {modulo}, que no está instalado')
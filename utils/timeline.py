@@ -15,18 +15,35 @@ def generate_execution_timeline(processes, algorithm, quantum=None):
     Returns:
         list: Timeline de datos para animación
     """
-    timeline_data = []
-    
-    if algorithm == 'fcfs':
-        timeline_data = _generate_fcfs_timeline(processes)
-    elif algorithm == 'sjf':
-        timeline_data = _generate_sjf_timeline(processes)
-    elif algorithm == 'rr':
-        timeline_data = _generate_rr_timeline(processes, quantum)
+    generador = _GENERADORES.get(algorithm)
+    if generador is None:
+        return []
     
-    return timeline_data
+    return generador(processes, quantum)
+
+def timeline_to_segments(timeline_data):
+    """
+    Compactar el timeline (una entrada por unidad de tiempo) en segmentos
+    de ejecución contiguos.
+
+    Args:
+        timeline_data: Lista generada por generate_execution_timeline
 
-def _generate_fcfs_timeline(processes):
+    Returns:
+        list: Lista de tuplas (pid, inicio, fin) con fin exclusivo
+    """
+    segmentos = []
+
+    for entrada in timeline_data:
+        pid, tiempo = entrada['process'], entrada['time']
+        if segmentos and segmentos[-1][0] == pid and segmentos[-1][2] == tiempo:
+            segmentos[-1][2] = tiempo + 1
+        else:
+            segmentos.append([pid, tiempo, tiempo + 1])
+
+    return [tuple(segmento) for segmento in segmentos]
+
+def _generate_fcfs_timeline(processes, quantum=None):
     """Generar timeline para FCFS"""
     timeline_data = []
     current_time = 0
@@ -47,7 +64,7 @@ def _generate_fcfs_timeline(processes):
     
     return timeline_data
 
-def _generate_sjf_timeline(processes):
+def _generate_sjf_timeline(processes, quantum=None):
     """Generar timeline para SJF"""
     timeline_data = []
     current_time = 0
@@ -121,4 +138,11 @@ def _generate_rr_timeline(processes, quantum):
         if process_remaining_time[pid] > 0:
             ready_queue.append((pid, arrival_time, burst_time))
     
-    return timeline_data
\ No newline at end of file
+    return timeline_data
+
+# Generador de timeline por algoritmo
+_GENERADORES = {
+    'fcfs': _generate_fcfs_timeline,
+    'sjf': _generate_sjf_timeline,
+    'rr': _generate_rr_timeline,
+}
\ No newline at end of file